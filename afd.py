@@ -0,0 +1,141 @@
+from collections import deque
+
+
+class AFD:
+    # Envoltorio sobre el diccionario que devuelve NFA.to_dfa(). Las transiciones
+    # que faltan van a un estado de rechazo implícito (None).
+    def __init__(self, states, alphabet, transitions, start_state, accept_states):
+        self.states = states
+        self.alphabet = alphabet
+        self.transitions = transitions
+        self.start_state = start_state
+        self.accept_states = accept_states
+
+    @classmethod
+    def from_dfa(cls, dfa):
+        if hasattr(dfa, 'step'):
+            return dfa
+        if isinstance(dfa, dict):
+            return cls(**dfa)
+        # DFA de automata-lib (hola.py)
+        return cls(states=set(dfa.states), alphabet=set(dfa.input_symbols),
+                   transitions={q: dict(t) for q, t in dfa.transitions.items()},
+                   start_state=dfa.initial_state, accept_states=set(dfa.final_states))
+
+    def step(self, state, symbol):
+        trans = self.transitions.get(state)
+        return trans.get(symbol) if trans else None
+
+    def is_accepting(self, state):
+        return state in self.accept_states
+
+    def accepts(self, input_string):
+        state = self.start_state
+        for symbol in input_string:
+            state = self.step(state, symbol)
+            if state is None:
+                return False
+        return self.is_accepting(state)
+
+    def to_dict(self):
+        return {
+            'states': self.states,
+            'alphabet': self.alphabet,
+            'transitions': self.transitions,
+            'start_state': self.start_state,
+            'accept_states': self.accept_states
+        }
+
+
+def desde_texto(estados, alfabeto, inicial, finales, trans):
+    # Mismo formato que los campos de hola.py: "q0,q1" | "a,b" | "q0" | "q1" | "q0,a,q1;q1,b,q0"
+    separar = lambda texto: {x.strip() for x in texto.split(',') if x.strip()}
+    transitions = {}
+    for t in trans.split(';'):
+        if not t.strip():
+            continue
+        p = [x.strip() for x in t.split(',')]
+        if len(p) != 3:
+            raise ValueError(f"Formato: {t}")
+        transitions.setdefault(p[0], {})[p[1]] = p[2]
+    return {
+        'states': separar(estados),
+        'alphabet': separar(alfabeto),
+        'transitions': transitions,
+        'start_state': inicial.strip(),
+        'accept_states': separar(finales)
+    }
+
+
+def alcanzables(dfa, alfabeto=None):
+    # BFS desde el inicial; funciona con cualquier objeto que tenga step/is_accepting
+    dfa = AFD.from_dfa(dfa)
+    alfabeto = sorted(dfa.alphabet if alfabeto is None else alfabeto)
+    orden = [dfa.start_state]
+    vistos = {dfa.start_state}
+    trans = {}
+    cola = deque(orden)
+    while cola:
+        q = cola.popleft()
+        trans[q] = {}
+        for s in alfabeto:
+            d = dfa.step(q, s)
+            if d is None:
+                continue
+            trans[q][s] = d
+            if d not in vistos:
+                vistos.add(d)
+                orden.append(d)
+                cola.append(d)
+    return orden, trans
+
+
+def vivos(dfa):
+    # Estados alcanzables desde los que todavía se puede llegar a uno final
+    dfa = AFD.from_dfa(dfa)
+    orden, trans = alcanzables(dfa)
+    utiles = {q for q in orden if dfa.is_accepting(q)}
+    cambio = True
+    while cambio:
+        cambio = False
+        for q in orden:
+            if q not in utiles and any(d in utiles for d in trans[q].values()):
+                utiles.add(q)
+                cambio = True
+    return utiles
+
+
+def minimizar(dfa):
+    # Refinamiento de particiones (Moore) sobre los estados alcanzables
+    dfa = AFD.from_dfa(dfa)
+    alfabeto = sorted(dfa.alphabet)
+    orden, trans = alcanzables(dfa, alfabeto)
+    bloque = {q: int(dfa.is_accepting(q)) for q in orden}
+    total = len(set(bloque.values()))
+    while True:
+        firmas = {}
+        nuevo = {}
+        for q in orden:
+            firma = (bloque[q],) + tuple(bloque.get(trans[q].get(s), -1) for s in alfabeto)
+            nuevo[q] = firmas.setdefault(firma, len(firmas))
+        bloque = nuevo
+        if len(firmas) == total:
+            break
+        total = len(firmas)
+    # Se renumera en orden BFS para que el inicial sea q0
+    nombres = {}
+    for q in orden:
+        if bloque[q] not in nombres:
+            nombres[bloque[q]] = f"q{len(nombres)}"
+    transitions = {}
+    for q in orden:
+        transitions.setdefault(nombres[bloque[q]], {
+            s: nombres[bloque[d]] for s, d in trans[q].items()
+        })
+    return {
+        'states': set(nombres.values()),
+        'alphabet': set(alfabeto),
+        'transitions': transitions,
+        'start_state': 'q0',
+        'accept_states': {nombres[bloque[q]] for q in orden if dfa.is_accepting(q)}
+    }
@@ -0,0 +1,138 @@
+from collections import deque
+
+from validador import ErrorSintaxis, analizar
+
+class NFA:
+    def __init__(self, states, alphabet, transitions, start_state, accept_states):
+        self.states = states
+        self.alphabet = alphabet
+        self.transitions = transitions
+        self.start_state = start_state
+        self.accept_states = accept_states
+    
+    def epsilon_closure(self, state_set):
+        closure = set(state_set)
+        stack = list(state_set)
+        while stack:
+            state = stack.pop()
+            if state in self.transitions and 'ε' in self.transitions[state]:
+                for next_state in self.transitions[state]['ε']:
+                    if next_state not in closure:
+                        closure.add(next_state)
+                        stack.append(next_state)
+        return closure
+    
+    def process_input(self, input_string):
+        current_states = self.epsilon_closure({self.start_state})
+        for symbol in input_string:
+            if symbol not in self.alphabet and symbol != 'ε':
+                return False, f"Símbolo '{symbol}' no está en el alfabeto"
+            next_states = set()
+            for state in current_states:
+                if state in self.transitions and symbol in self.transitions[state]:
+                    next_states.update(self.transitions[state][symbol])
+            current_states = self.epsilon_closure(next_states)
+            if not current_states:
+                return False, "Sin estados activos"
+        accepted = any(state in self.accept_states for state in current_states)
+        return accepted, "Aceptado" if accepted else "Rechazado"
+    
+    def to_dfa(self):
+        dfa_states = set()
+        dfa_transitions = {}
+        dfa_start_state = frozenset(self.epsilon_closure({self.start_state}))
+        dfa_accept_states = set()
+        queue = deque([dfa_start_state])
+        dfa_states.add(dfa_start_state)
+        if any(state in self.accept_states for state in dfa_start_state):
+            dfa_accept_states.add(dfa_start_state)
+        while queue:
+            current_dfa_state = queue.popleft()
+            dfa_transitions[current_dfa_state] = {}
+            for symbol in self.alphabet:
+                if symbol == 'ε':
+                    continue
+                next_nfa_states = set()
+                for nfa_state in current_dfa_state:
+                    if nfa_state in self.transitions and symbol in self.transitions[nfa_state]:
+                        next_nfa_states.update(self.transitions[nfa_state][symbol])
+                next_dfa_state = frozenset(self.epsilon_closure(next_nfa_states))
+                if not next_dfa_state:
+                    next_dfa_state = frozenset(['qT'])
+                    if next_dfa_state not in dfa_states:
+                        dfa_states.add(next_dfa_state)
+                        queue.append(next_dfa_state)
+                dfa_transitions[current_dfa_state][symbol] = next_dfa_state
+                if next_dfa_state not in dfa_states:
+                    dfa_states.add(next_dfa_state)
+                    queue.append(next_dfa_state)
+                    if any(state in self.accept_states for state in next_dfa_state):
+                        dfa_accept_states.add(next_dfa_state)
+        for state in list(dfa_states):
+            if state == frozenset(['qT']):
+                if state not in dfa_transitions:
+                    dfa_transitions[state] = {}
+                for symbol in self.alphabet:
+                    if symbol != 'ε':
+                        dfa_transitions[state][symbol] = state
+        state_mapping = {state: f"q{i}" for i, state in enumerate(sorted(dfa_states, key=str))}
+        readable_transitions = {}
+        for state, transitions in dfa_transitions.items():
+            readable_state = state_mapping[state]
+            readable_transitions[readable_state] = {
+                symbol: state_mapping[next_state] 
+                for symbol, next_state in transitions.items()
+            }
+        return {
+            'states': set(state_mapping.values()),
+            'alphabet': self.alphabet - {'ε'},
+            'transitions': readable_transitions,
+            'start_state': state_mapping[dfa_start_state],
+            'accept_states': {state_mapping[s] for s in dfa_accept_states}
+        }
+
+def er_to_nfa(regex):
+    # Construcción de Thompson sobre el AST de validador.analizar, así el parser
+    # y el conversor usan la misma gramática y la misma cache
+    state_counter = [0]
+    def new_state():
+        state_counter[0] += 1
+        return f"q{state_counter[0]}"
+    def build_nfa(node):
+        kind = node[0]
+        if kind == 'sym':
+            start = new_state()
+            accept = new_state()
+            return {'start': start,'accept': accept,'transitions': {start: {node[1]: {accept}}},'states': {start, accept}}
+        if kind == 'star':
+            base = build_nfa(node[1])
+            new_start = new_state()
+            new_accept = new_state()
+            transitions = base['transitions']
+            transitions[new_start] = {'ε': {base['start'], new_accept}}
+            transitions[base['accept']] = {'ε': {base['start'], new_accept}}
+            return {'start': new_start,'accept': new_accept,'transitions': transitions,'states': base['states'] | {new_start, new_accept}}
+        parts = [build_nfa(child) for child in node[1]]
+        transitions = {}
+        states = set()
+        for part in parts:
+            transitions.update(part['transitions'])
+            states |= part['states']
+        if kind == 'alt':
+            new_start = new_state()
+            new_accept = new_state()
+            transitions[new_start] = {'ε': {part['start'] for part in parts}}
+            for part in parts:
+                transitions[part['accept']] = {'ε': {new_accept}}
+            return {'start': new_start,'accept': new_accept,'transitions': transitions,'states': states | {new_start, new_accept}}
+        for left, right in zip(parts, parts[1:]):
+            transitions[left['accept']] = {'ε': {right['start']}}
+        return {'start': parts[0]['start'],'accept': parts[-1]['accept'],'transitions': transitions,'states': states}
+    try:
+        nfa_data = build_nfa(analizar(regex))
+    except ErrorSintaxis:
+        return None
+    alphabet = {'ε'}
+    for trans in nfa_data['transitions'].values():
+        alphabet.update(trans.keys())
+    return NFA(states=nfa_data['states'],alphabet=alphabet,transitions=nfa_data['transitions'],start_state=nfa_data['start'],accept_states={nfa_data['accept']})
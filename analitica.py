@@ -0,0 +1,162 @@
+import random
+import sys
+
+from afd import AFD, alcanzables
+
+try:
+    import numpy as np
+    NUMPY = True
+except ImportError:
+    NUMPY = False
+
+
+class _Tabla:
+    # Tabla de transiciones por índice y conteos hacia atrás:
+    # cuenta[r][i] = cantidad de cadenas de longitud r que el estado i lleva a un final
+    def __init__(self, dfa):
+        dfa = AFD.from_dfa(dfa)
+        self.alfabeto = sorted(dfa.alphabet)
+        orden, trans = alcanzables(dfa, self.alfabeto)
+        num = {q: i for i, q in enumerate(orden)}
+        self.n = len(orden)
+        self.trans = [[(s, num[d]) for s, d in sorted(trans[q].items())] for q in orden]
+        self.cuenta = [[int(dfa.is_accepting(q)) for q in orden]]
+
+    def filas(self):
+        # Genera las filas una por una sin guardarlas; contar solo necesita la anterior
+        fila = self.cuenta[0]
+        while True:
+            yield fila
+            fila = [sum(fila[j] for _, j in t) for t in self.trans]
+
+    def hasta(self, longitud):
+        # Tabla completa: la usan muestra y palabras_mas_cortas, que recorren todas las filas
+        while len(self.cuenta) <= longitud:
+            previa = self.cuenta[-1]
+            self.cuenta.append([sum(previa[j] for _, j in t) for t in self.trans])
+        return self.cuenta
+
+
+def _revisar(longitud):
+    # Con una longitud negativa los bucles de abajo no terminarían nunca
+    if longitud < 0:
+        raise ValueError(f"Longitud negativa: {longitud}")
+
+
+def contar(dfa, longitud):
+    # Programación dinámica: O(longitud · transiciones) con enteros de Python
+    _revisar(longitud)
+    for r, fila in enumerate(_Tabla(dfa).filas()):
+        if r == longitud:
+            return fila[0]
+
+
+def contar_hasta(dfa, longitud):
+    _revisar(longitud)
+    totales = []
+    for fila in _Tabla(dfa).filas():
+        totales.append(fila[0])
+        if len(totales) > longitud:
+            return totales
+
+
+def _matriz(tabla):
+    m = [[0] * tabla.n for _ in range(tabla.n)]
+    for i, t in enumerate(tabla.trans):
+        for _, j in t:
+            m[i][j] += 1
+    return m
+
+
+def _multiplicar(a, b):
+    return [[sum(x * y for x, y in zip(fila, col)) for col in zip(*b)] for fila in a]
+
+
+def contar_potencia(dfa, longitud):
+    # Potencia de la matriz de adyacencia: O(estados³ · log longitud), útil para longitudes grandes
+    _revisar(longitud)
+    tabla = _Tabla(dfa)
+    finales = tabla.cuenta[0]
+    if NUMPY:
+        m = np.array(_matriz(tabla), dtype=object)
+        fila = np.linalg.matrix_power(m, longitud)[0]
+        return int(sum(x * f for x, f in zip(fila, finales)))
+    resultado = [[int(i == j) for j in range(tabla.n)] for i in range(tabla.n)]
+    base = _matriz(tabla)
+    while longitud:
+        if longitud & 1:
+            resultado = _multiplicar(resultado, base)
+        base = _multiplicar(base, base)
+        longitud >>= 1
+    return sum(x * f for x, f in zip(resultado[0], finales))
+
+
+def palabras_mas_cortas(dfa, cantidad):
+    # Orden por longitud y luego lexicográfico; solo se baja por estados que aún pueden
+    # aceptar con la longitud restante, así cada palabra cuesta O(longitud · |alfabeto|)
+    tabla = _Tabla(dfa)
+    palabras = []
+    longitud = 0
+    vacias = 0
+    while len(palabras) < cantidad and vacias < tabla.n:
+        cuenta = tabla.hasta(longitud)
+        if cuenta[longitud][0]:
+            vacias = 0
+            pila = [(0, longitud, "")]
+            while pila and len(palabras) < cantidad:
+                i, resto, prefijo = pila.pop()
+                if resto == 0:
+                    palabras.append(prefijo)
+                    continue
+                for s, j in reversed(tabla.trans[i]):
+                    if cuenta[resto - 1][j]:
+                        pila.append((j, resto - 1, prefijo + s))
+        else:
+            # Si el lenguaje es infinito hay una palabra en cada ventana de tantas longitudes como estados
+            vacias += 1
+        longitud += 1
+    return palabras
+
+
+def muestra(dfa, longitud, cantidad=1, semilla=None):
+    # Muestreo uniforme entre las cadenas aceptadas de esa longitud (None si no hay ninguna)
+    _revisar(longitud)
+    tabla = _Tabla(dfa)
+    cuenta = tabla.hasta(longitud)
+    if not cuenta[longitud][0]:
+        return None
+    r = random.Random(semilla)
+    palabras = []
+    for _ in range(cantidad):
+        i, palabra = 0, []
+        for resto in range(longitud, 0, -1):
+            x = r.randrange(cuenta[resto][i])
+            for s, j in tabla.trans[i]:
+                if x < cuenta[resto - 1][j]:
+                    palabra.append(s)
+                    i = j
+                    break
+                x -= cuenta[resto - 1][j]
+        palabras.append(''.join(palabra))
+    return palabras
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Uso: python analitica.py ER LONGITUD")
+        sys.exit(2)
+    from afnd import er_to_nfa
+    from validador import validar
+    error = validar(sys.argv[1])
+    if error:
+        print(f"{sys.argv[1]!r}: {error}")
+        sys.exit(2)
+    if not sys.argv[2].isdigit():
+        print(f"La longitud debe ser un entero no negativo: {sys.argv[2]!r}")
+        sys.exit(2)
+    dfa = er_to_nfa(sys.argv[1]).to_dfa()
+    n = int(sys.argv[2])
+    for longitud, total in enumerate(contar_hasta(dfa, n)):
+        print(f"longitud {longitud}: {total}")
+    print("Más cortas:", palabras_mas_cortas(dfa, 10))
+    print(f"Muestra de longitud {n}:", muestra(dfa, n, 5))
@@ -0,0 +1,18 @@
+import itertools
+
+
+def afd_al_azar(r, estados, alfabeto):
+    # Con transiciones faltantes, que van al rechazo implícito
+    qs = [f"q{i}" for i in range(estados)]
+    return {
+        'states': set(qs),
+        'alphabet': set(alfabeto),
+        'transitions': {q: {s: r.choice(qs) for s in alfabeto if r.random() > 0.2} for q in qs},
+        'start_state': 'q0',
+        'accept_states': {q for q in qs if r.random() < 0.4}
+    }
+
+
+def palabras(alfabeto, longitud):
+    # Todas las cadenas sobre el alfabeto hasta esa longitud, en orden por longitud
+    return [''.join(p) for n in range(longitud + 1) for p in itertools.product(alfabeto, repeat=n)]
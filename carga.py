@@ -0,0 +1,138 @@
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import time
+from collections import deque
+
+from servidor import HOST, PUERTO
+
+PATRONES = ["ab|ba", "a*", "abc|c*", "ab*", "a|b|c", "aab|bba|ab", "cab|abc*"]
+
+
+async def _conectar(args):
+    if args.unix:
+        return await asyncio.open_unix_connection(args.unix)
+    return await asyncio.open_connection(args.host, args.puerto)
+
+
+async def _cliente(args, latencias, semilla):
+    reader, writer = await _conectar(args)
+    r = random.Random(semilla)
+    # El servidor responde en orden, así que cada respuesta corresponde al envío más
+    # antiguo pendiente; no hace falta el id (las respuestas de error pueden no traerlo)
+    enviados = deque()
+    errores = recibidas = 0
+    cerrada = False
+
+    async def leer():
+        nonlocal errores, recibidas, cerrada
+        for _ in range(args.peticiones):
+            linea = await reader.readline()
+            if not linea:
+                break
+            try:
+                ok = json.loads(linea).get('ok', False)
+            except ValueError:
+                ok = False
+            if not ok:
+                errores += 1
+            latencias.append(time.perf_counter() - enviados.popleft())
+            recibidas += 1
+            ventana.release()
+        # Fin de las respuestas o conexión cerrada por el servidor: se libera al emisor
+        cerrada = True
+        ventana.release()
+
+    # Como mucho args.profundidad peticiones en vuelo por conexión
+    ventana = asyncio.Semaphore(args.profundidad)
+    lector = asyncio.create_task(leer())
+    try:
+        for i in range(args.peticiones):
+            await ventana.acquire()
+            if cerrada:
+                break
+            regex = r.choice(PATRONES)
+            cadena = ''.join(r.choice("abc") for _ in range(args.longitud))
+            peticion = {'id': i, 'op': args.op, 'regex': regex}
+            if args.op == 'batch':
+                peticion['cadenas'] = [cadena] * args.lote
+            else:
+                peticion['cadena'] = cadena
+            enviados.append(time.perf_counter())
+            writer.write(json.dumps(peticion).encode() + b"\n")
+            await writer.drain()
+    except ConnectionError:
+        pass
+    await lector
+    writer.close()
+    # Lo que quedó sin respuesta (conexión cerrada) también cuenta como error
+    return errores + args.peticiones - recibidas
+
+
+async def _stats(args):
+    reader, writer = await _conectar(args)
+    writer.write(b'{"op": "stats"}\n')
+    linea = await reader.readline()
+    writer.close()
+    return json.loads(linea).get('resultado') if linea else None
+
+
+async def _esperar_servidor(args, intentos=50):
+    for _ in range(intentos):
+        try:
+            _, writer = await _conectar(args)
+            writer.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.1)
+    raise RuntimeError("El servidor no respondió")
+
+
+async def _main(args):
+    await _esperar_servidor(args)
+    latencias = []
+    t = time.perf_counter()
+    errores = await asyncio.gather(*(_cliente(args, latencias, i) for i in range(args.conexiones)))
+    total = time.perf_counter() - t
+    latencias.sort()
+    n = len(latencias)
+    print(f"{n} peticiones en {total:.3f} s: {n / total:,.0f} req/s, {sum(errores)} errores")
+    if n:
+        print(f"p50 {latencias[n // 2] * 1e3:.3f} ms, p99 {latencias[min(n - 1, int(n * 0.99))] * 1e3:.3f} ms")
+    else:
+        print("No llegó ninguna respuesta")
+    try:
+        stats = await _stats(args)
+    except (OSError, ValueError):
+        stats = None
+    print(json.dumps(stats, indent=2, ensure_ascii=False) if stats else "El servidor no devolvió estadísticas")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Prueba de carga para servidor.py")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--puerto", type=int, default=PUERTO)
+    parser.add_argument("--unix")
+    parser.add_argument("--conexiones", type=int, default=8)
+    parser.add_argument("--peticiones", type=int, default=2000, help="por conexión")
+    parser.add_argument("--profundidad", type=int, default=16, help="peticiones en vuelo por conexión")
+    parser.add_argument("--op", choices=["match", "batch", "search"], default="match")
+    parser.add_argument("--lote", type=int, default=10)
+    parser.add_argument("--longitud", type=int, default=20)
+    parser.add_argument("--lanzar", action="store_true", help="arranca servidor.py en otro proceso")
+    args = parser.parse_args()
+    proceso = None
+    if args.lanzar:
+        comando = [sys.executable, "servidor.py", "--host", args.host, "--puerto", str(args.puerto)]
+        if args.unix:
+            comando += ["--unix", args.unix]
+        proceso = subprocess.Popen(comando)
+    try:
+        asyncio.run(_main(args))
+    finally:
+        if proceso:
+            proceso.terminate()
+            proceso.wait()
@@ -0,0 +1,176 @@
+import hashlib
+import importlib.util
+import os
+import random
+import sys
+import tempfile
+import time
+
+from afd import AFD, alcanzables, vivos
+
+NOMBRE = "coincide"
+
+
+def generar_codigo(dfa, nombre=NOMBRE):
+    # Tabla de saltos: una tupla con un diccionario por estado, pasada como argumento por
+    # defecto para que T y F sean variables locales (LOAD_FAST) y no celdas de la clausura.
+    # El bucle interno hace una sola búsqueda por carácter sin importar el tamaño del
+    # alfabeto, y un símbolo sin transición sale por KeyError (el try no cuesta en el bucle).
+    dfa = AFD.from_dfa(dfa)
+    alfabeto = sorted(dfa.alphabet)
+    orden, trans = alcanzables(dfa, alfabeto)
+    # Las transiciones a estados muertos se quitan para rechazar en cuanto se llega a uno
+    utiles = vivos(dfa)
+    orden = [q for q in orden if q in utiles or q == dfa.start_state]
+    num = {q: i for i, q in enumerate(orden)}
+    finales = sorted(num[q] for q in orden if dfa.is_accepting(q))
+    lineas = [
+        "def _crear():",
+        "    T = (",
+    ]
+    for q in orden:
+        tabla = {s: num[d] for s, d in sorted(trans[q].items()) if d in utiles}
+        lineas.append(f"        {tabla!r},")
+    lineas += [
+        "    )",
+        f"    F = frozenset({finales!r})",
+        "",
+        f"    def {nombre}(s, T=T, F=F):",
+        "        q = 0",
+        "        try:",
+        "            for c in s:",
+        "                q = T[q][c]",
+        "        except KeyError:",
+        "            return False",
+        "        return q in F",
+        "",
+        f"    return {nombre}",
+        "",
+        "",
+        f"{nombre} = _crear()",
+    ]
+    return "\n".join(lineas) + "\n"
+
+
+def compilar(dfa, nombre=NOMBRE):
+    return ejecutar(generar_codigo(dfa, nombre), nombre)
+
+
+def ejecutar(codigo, nombre=NOMBRE):
+    espacio = {}
+    exec(compile(codigo, f"<afd:{nombre}>", "exec"), espacio)
+    return espacio[nombre]
+
+
+def _huella(codigo):
+    return hashlib.sha1(codigo.encode("utf-8")).hexdigest()[:16]
+
+
+def compilar_en_cache(dfa, carpeta="__afd_cache__", nombre=NOMBRE):
+    # Guarda el código como módulo .py; importarlo después deja que Python use su propio .pyc
+    codigo = generar_codigo(dfa, nombre)
+    modulo = f"afd_{_huella(codigo)}"
+    ruta = os.path.join(carpeta, modulo + ".py")
+    if not os.path.exists(ruta):
+        os.makedirs(carpeta, exist_ok=True)
+        # Un temporal con nombre único por proceso: si dos procesos guardan el mismo AFD,
+        # cada uno reemplaza con su propio archivo y el resultado es el mismo
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=carpeta, suffix=".tmp",
+                                         delete=False) as f:
+            f.write(codigo)
+        os.replace(f.name, ruta)
+    return getattr(cargar_modulo(ruta, modulo), nombre)
+
+
+def cargar_modulo(ruta, modulo=None):
+    modulo = modulo or os.path.splitext(os.path.basename(ruta))[0]
+    if modulo in sys.modules:
+        return sys.modules[modulo]
+    spec = importlib.util.spec_from_file_location(modulo, ruta)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    sys.modules[modulo] = mod
+    return mod
+
+
+def _cadena_larga(dfa, longitud, semilla=0):
+    # Paseo aleatorio por estados vivos que todavía tienen un ciclo por delante,
+    # para que ningún matcher termine antes de tiempo
+    _, trans = alcanzables(dfa)
+    utiles = vivos(dfa)
+    cambio = True
+    while cambio:
+        cambio = False
+        for q in list(utiles):
+            if not any(d in utiles for d in trans[q].values()):
+                utiles.discard(q)
+                cambio = True
+    r = random.Random(semilla)
+    q = dfa.start_state
+    cadena = []
+    while len(cadena) < longitud:
+        opciones = [(s, d) for s, d in sorted(trans.get(q, {}).items()) if d in utiles]
+        if not opciones:
+            break
+        s, q = r.choice(opciones)
+        cadena.append(s)
+    return ''.join(cadena)
+
+
+def afd_alfanumerico(estados=16, semilla=0):
+    # AFD completo sobre [a-z0-9] al estilo de un tokenizador: la mayoría de los
+    # símbolos dejan al autómata en el mismo estado y el resto lo mueve a otro
+    r = random.Random(semilla)
+    alfabeto = "abcdefghijklmnopqrstuvwxyz0123456789"
+    nombres = [f"q{i}" for i in range(estados)]
+    return {
+        'states': set(nombres),
+        'alphabet': set(alfabeto),
+        'transitions': {q: {s: q if r.random() < 0.6 else r.choice(nombres) for s in alfabeto}
+                        for q in nombres},
+        'start_state': 'q0',
+        'accept_states': set(nombres[::2])
+    }
+
+
+def benchmark(patron, longitud=100000, repeticiones=5):
+    # patron puede ser una ER o directamente un AFD
+    candidatos = []
+    if isinstance(patron, str):
+        from afnd import er_to_nfa
+        nfa = er_to_nfa(patron)
+        dfa = nfa.to_dfa()
+        candidatos.append(("AFND", lambda s: nfa.process_input(s)[0]))
+    else:
+        dfa = patron
+    afd = AFD.from_dfa(dfa)
+    cadena = _cadena_larga(afd, longitud)
+    candidatos = [("codigo generado", compilar(dfa)), ("diccionario", afd.accepts)] + candidatos
+    resultados = {}
+    for nombre, f in candidatos:
+        t = time.perf_counter()
+        for _ in range(repeticiones):
+            f(cadena)
+        resultados[nombre] = max(len(cadena), 1) * repeticiones / (time.perf_counter() - t)
+    return resultados
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 2 and sys.argv[1] == "--bench-alfanumerico":
+        for nombre, tasa in benchmark(afd_alfanumerico()).items():
+            print(f"{nombre}: {tasa:,.0f} símbolos/s")
+        sys.exit(0)
+    if len(sys.argv) < 2:
+        print("Uso: python codegen.py ER [--bench] | python codegen.py --bench-alfanumerico")
+        sys.exit(2)
+    from validador import validar
+    error = validar(sys.argv[1])
+    if error:
+        print(f"{sys.argv[1]!r}: {error}")
+        sys.exit(2)
+    if "--bench" in sys.argv[2:]:
+        for nombre, tasa in benchmark(sys.argv[1]).items():
+            print(f"{nombre}: {tasa:,.0f} símbolos/s")
+    else:
+        from afnd import er_to_nfa
+        print(generar_codigo(er_to_nfa(sys.argv[1]).to_dfa()))
@@ -0,0 +1,156 @@
+import sys
+import time
+from collections import deque
+
+from afd import AFD, desde_texto
+from producto import union
+from validador import validar
+
+
+def _raiz(padre, x):
+    padre.setdefault(x, x)
+    while padre[x] != x:
+        padre[x] = padre[padre[x]]
+        x = padre[x]
+    return x
+
+
+def _hopcroft_karp(a, b, alfabeto):
+    # Los estados se etiquetan con 0/1 porque ambos AFD suelen usar los mismos nombres (q0, q1...)
+    padre, rango = {}, {}
+    cola = deque([(a.start_state, b.start_state)])
+    padre[(0, a.start_state)] = (1, b.start_state)
+    padre[(1, b.start_state)] = (1, b.start_state)
+    while cola:
+        p, q = cola.popleft()
+        if a.is_accepting(p) != b.is_accepting(q):
+            return False
+        for s in alfabeto:
+            p2, q2 = a.step(p, s), b.step(q, s)
+            x, y = _raiz(padre, (0, p2)), _raiz(padre, (1, q2))
+            if x == y:
+                continue
+            if rango.get(x, 0) > rango.get(y, 0):
+                x, y = y, x
+            padre[x] = y
+            if rango.get(x, 0) == rango.get(y, 0):
+                rango[y] = rango.get(y, 0) + 1
+            cola.append((p2, q2))
+    return True
+
+
+def _contraejemplo(a, b, alfabeto, distingue):
+    # BFS sobre los pares alcanzables: da la cadena más corta (y la menor en orden lexicográfico)
+    inicio = (a.start_state, b.start_state)
+    previo = {inicio: None}
+    cola = deque([inicio])
+    while cola:
+        par = cola.popleft()
+        if distingue(a.is_accepting(par[0]), b.is_accepting(par[1])):
+            cadena = []
+            while previo[par]:
+                par, s = previo[par]
+                cadena.append(s)
+            return ''.join(reversed(cadena))
+        for s in alfabeto:
+            sig = (a.step(par[0], s), b.step(par[1], s))
+            if sig not in previo:
+                previo[sig] = (par, s)
+                cola.append(sig)
+    return None
+
+
+def equivalentes(a, b):
+    # Devuelve (True, None) o (False, contraejemplo más corto)
+    a, b = AFD.from_dfa(a), AFD.from_dfa(b)
+    alfabeto = sorted(a.alphabet | b.alphabet)
+    if _hopcroft_karp(a, b, alfabeto):
+        return True, None
+    return False, _contraejemplo(a, b, alfabeto, lambda fa, fb: fa != fb)
+
+
+def incluido(a, b):
+    # L(a) ⊆ L(b) <=> L(a ∪ b) = L(b); el contraejemplo es la cadena más corta aceptada por a y no por b
+    a, b = AFD.from_dfa(a), AFD.from_dfa(b)
+    alfabeto = sorted(a.alphabet | b.alphabet)
+    if _hopcroft_karp(union(a, b), b, alfabeto):
+        return True, None
+    return False, _contraejemplo(a, b, alfabeto, lambda fa, fb: fa and not fb)
+
+
+def _oraculo_automata_lib(patron, alfabeto):
+    # Compilador independiente: ER -> AFND -> AFD -> minify() de automata-lib (el de hola.py)
+    try:
+        from automata.fa.dfa import DFA
+        from automata.fa.nfa import NFA
+    except ImportError:
+        return None
+    return DFA.from_nfa(NFA.from_regex(patron, input_symbols=alfabeto)).minify()
+
+
+def regresion(lineas):
+    # Cada línea es "ER" o "ER<TAB>estados<TAB>alfabeto<TAB>inicial<TAB>finales<TAB>trans" con el
+    # AFD esperado en el formato de hola.py. Sin AFD esperado se usa automata-lib como oráculo.
+    from afnd import er_to_nfa
+    fallos, sin_oraculo = [], []
+    for linea in lineas:
+        campos = linea.split('\t')
+        patron = campos[0].strip()
+        error = validar(patron)
+        if error:
+            fallos.append((patron, str(error)))
+            continue
+        dfa = er_to_nfa(patron).to_dfa()
+        if len(campos) == 6:
+            try:
+                esperado = desde_texto(*campos[1:])
+            except ValueError as e:
+                fallos.append((patron, str(e)))
+                continue
+        elif len(campos) == 1:
+            esperado = _oraculo_automata_lib(patron, dfa['alphabet'])
+            if esperado is None:
+                sin_oraculo.append(patron)
+                continue
+        else:
+            fallos.append((patron, "se esperaban 1 o 6 campos separados por tabuladores"))
+            continue
+        ok, cadena = equivalentes(dfa, esperado)
+        if not ok:
+            fallos.append((patron, f"difieren en {cadena!r}"))
+    return fallos, sin_oraculo
+
+
+def _compilar(er):
+    from afnd import er_to_nfa
+    error = validar(er)
+    if error:
+        print(f"{er!r}: {error}")
+        sys.exit(2)
+    return er_to_nfa(er).to_dfa()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "--archivo":
+        with open(sys.argv[2], encoding="utf-8") as f:
+            lineas = [l.rstrip("\r\n") for l in f if l.strip()]
+        t = time.perf_counter()
+        fallos, sin_oraculo = regresion(lineas)
+        total = time.perf_counter() - t
+        for patron, motivo in fallos:
+            print(f"{patron!r}: {motivo}")
+        if sin_oraculo:
+            print(f"{len(sin_oraculo)} patrones sin AFD esperado (pip install automata-lib)")
+        revisados = len(lineas) - len(sin_oraculo)
+        print(f"{revisados - len(fallos)}/{revisados} patrones correctos ({total:.3f} s)")
+        # Una corrida que no revisó nada (o que dejó patrones sin revisar) no cuenta como éxito
+        sys.exit(1 if fallos or sin_oraculo or not revisados else 0)
+    if len(sys.argv) != 3:
+        print("Uso: python equivalencia.py ER1 ER2 | python equivalencia.py --archivo patrones.txt")
+        sys.exit(2)
+    a, b = (_compilar(er) for er in sys.argv[1:])
+    ok, cadena = equivalentes(a, b)
+    print("Equivalentes" if ok else f"No equivalentes: {cadena!r}")
+    for x, y, nombre in ((a, b, "L1 ⊆ L2"), (b, a, "L2 ⊆ L1")):
+        ok, cadena = incluido(x, y)
+        print(f"{nombre}: " + ("sí" if ok else f"no ({cadena!r})"))
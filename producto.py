@@ -0,0 +1,120 @@
+from afd import AFD, alcanzables, minimizar, vivos
+
+
+class _Sumidero:
+    # Cada complemento tiene su propio qT para no confundirlo con un estado del AFD original
+    def __repr__(self):
+        return 'qT'
+
+
+_OPERACIONES = {
+    'interseccion': lambda fa, fb: fa and fb,
+    'union': lambda fa, fb: fa or fb,
+    'diferencia': lambda fa, fb: fa and not fb,
+}
+
+
+class _Perezoso:
+    # Las transiciones se calculan al pedirlas y se guardan en self.cache,
+    # así solo se exploran los estados alcanzables por las cadenas que se prueban
+    def __init__(self, alphabet, start_state):
+        self.alphabet = alphabet
+        self.start_state = start_state
+        self.cache = {}
+
+    def step(self, state, symbol):
+        if state is None or symbol not in self.alphabet:
+            return None
+        key = (state, symbol)
+        if key not in self.cache:
+            self.cache[key] = self._step(state, symbol)
+        return self.cache[key]
+
+    def accepts(self, input_string):
+        state = self.start_state
+        for symbol in input_string:
+            state = self.step(state, symbol)
+            if state is None:
+                return False
+        return self.is_accepting(state)
+
+    def to_dict(self):
+        orden, trans = alcanzables(self)
+        state_mapping = {state: f"q{i}" for i, state in enumerate(orden)}
+        return {
+            'states': set(state_mapping.values()),
+            'alphabet': set(self.alphabet),
+            'transitions': {
+                state_mapping[q]: {s: state_mapping[d] for s, d in t.items()}
+                for q, t in trans.items()
+            },
+            'start_state': state_mapping[self.start_state],
+            'accept_states': {state_mapping[q] for q in orden if self.is_accepting(q)}
+        }
+
+    def minimizar(self):
+        return minimizar(self)
+
+
+class Producto(_Perezoso):
+    def __init__(self, a, b, operacion):
+        if operacion not in _OPERACIONES:
+            raise ValueError(f"Operación desconocida: {operacion}")
+        self.a, self.b = AFD.from_dfa(a), AFD.from_dfa(b)
+        self.operacion = operacion
+        self._acepta = _OPERACIONES[operacion]
+        # Los estados muertos de cada operando (como el qT explícito de to_dfa) cuentan
+        # como None, así los pares que ya no pueden aceptar se cortan y no se exploran
+        self.vivos_a, self.vivos_b = vivos(self.a), vivos(self.b)
+        super().__init__(self.a.alphabet | self.b.alphabet,
+                         self._par(self.a.start_state, self.b.start_state))
+
+    def _par(self, p, q):
+        return (p if p in self.vivos_a else None, q if q in self.vivos_b else None)
+
+    def _step(self, state, symbol):
+        p, q = self._par(self.a.step(state[0], symbol), self.b.step(state[1], symbol))
+        # Pares que ya no pueden aceptar nada se cortan para no crecer el producto
+        if p is None and (q is None or self.operacion != 'union'):
+            return None
+        if q is None and self.operacion == 'interseccion':
+            return None
+        return (p, q)
+
+    def is_accepting(self, state):
+        if state is None:
+            return False
+        return self._acepta(self.a.is_accepting(state[0]), self.b.is_accepting(state[1]))
+
+
+class Complemento(_Perezoso):
+    # Complemento respecto al alfabeto del AFD; las transiciones que faltan van a qT, que pasa a ser final
+    def __init__(self, a):
+        self.a = AFD.from_dfa(a)
+        self.sumidero = _Sumidero()
+        super().__init__(set(self.a.alphabet), self.a.start_state)
+
+    def _step(self, state, symbol):
+        if state is self.sumidero:
+            return state
+        d = self.a.step(state, symbol)
+        return self.sumidero if d is None else d
+
+    def is_accepting(self, state):
+        return state is not None and (state is self.sumidero or not self.a.is_accepting(state))
+
+
+def interseccion(a, b):
+    return Producto(a, b, 'interseccion')
+
+
+def union(a, b):
+    return Producto(a, b, 'union')
+
+
+def diferencia(a, b):
+    return Producto(a, b, 'diferencia')
+
+
+def complemento(a):
+    return Complemento(a)
@@ -1,11 +1,7 @@
 import pygame
 import sys
 
-try:
-    from pyformlang.regular_expression import Regex
-    LIB = True
-except:
-    LIB = False
+from validador import validar
 
 pygame.init()
 
@@ -28,11 +24,8 @@ class App:
         self.activo = False
 
     def validar(self):
-        try:
-            _ = Regex(self.input)
-            self.msg = "Expresion válida"
-        except Exception as e:
-            self.msg = "Error: " + str(e)
+        error = validar(self.input)
+        self.msg = "Error: " + str(error) if error else "Expresion válida"
 
     def draw_input(self):
         y = 20
@@ -40,8 +33,7 @@ class App:
         win.blit(t, (W//2 - t.get_width()//2, y))
         y += 60
 
-        info_lib = fs.render("✓ pyformlang" if LIB else " pip install pyformlang",
-                             True, GREEN if LIB else RED)
+        info_lib = fs.render("✓ validador nativo", True, GREEN)
         win.blit(info_lib, (W//2 - info_lib.get_width()//2, y))
         y += 50
 
@@ -64,7 +56,7 @@ class App:
         win.blit(surf, (self.rect_input.x + 10, self.rect_input.y + 10))
 
         btn = pygame.Rect(W//2 - 150, H - 100, 300, 50)
-        pygame.draw.rect(win, GREEN if LIB else GRAY, btn, border_radius=10)
+        pygame.draw.rect(win, GREEN, btn, border_radius=10)
         win.blit(fl.render("VALIDAR", True, WHITE), (btn.centerx - 55, btn.centery - 12))
 
         btn_menu = pygame.Rect(20, 20, 140, 40)
@@ -76,14 +68,14 @@ class App:
             m = fs.render(self.msg, True, GREEN if "válida" in self.msg else RED)
             win.blit(m, (W//2 - m.get_width()//2, H - 150))
 
-        return btn if LIB else None
+        return btn
 
     def event(self, e):
         if e.type == pygame.MOUSEBUTTONDOWN:
             if self.rect_input.collidepoint(e.pos):
                 self.activo = True
                 return
-            if LIB and pygame.Rect(W//2 - 150, H - 100, 300, 50).collidepoint(e.pos):
+            if pygame.Rect(W//2 - 150, H - 100, 300, 50).collidepoint(e.pos):
                 self.validar()
                 return
             if hasattr(self, "btn_menu_input") and self.btn_menu_input.collidepoint(e.pos):
@@ -0,0 +1,253 @@
+import argparse
+import asyncio
+import json
+import signal
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from afd import AFD, vivos
+from afnd import er_to_nfa
+from codegen import ejecutar, generar_codigo
+from validador import validar
+
+HOST, PUERTO = "127.0.0.1", 8765
+CACHE_MAX = 256
+EN_VUELO_MAX = 64
+OPERACIONES = ('match', 'batch', 'search')
+
+
+def _compilar_en_proceso(regex):
+    # Se corre en el pool: devuelve datos que se pueden pasar entre procesos
+    nfa = er_to_nfa(regex)
+    if nfa is None:
+        raise ValueError(f"{regex!r}: {validar(regex)}")
+    dfa = nfa.to_dfa()
+    return dfa, generar_codigo(dfa)
+
+
+def buscar(dfa, utiles, cadena):
+    # Primera coincidencia más a la izquierda y, entre ellas, la más larga.
+    # Recibe el AFD ya compilado (un dict se puede mandar al pool tal cual) y sus
+    # estados vivos: fuera de ellos ya no se puede aceptar y la búsqueda se corta.
+    dfa = AFD.from_dfa(dfa)
+    step, final = dfa.step, dfa.is_accepting
+    for inicio in range(len(cadena) + 1):
+        q = dfa.start_state
+        fin = inicio if final(q) else None
+        for j in range(inicio, len(cadena)):
+            q = step(q, cadena[j])
+            if q not in utiles:
+                break
+            if final(q):
+                fin = j + 1
+        if fin is not None:
+            return [inicio, fin]
+    return None
+
+
+class Compilado:
+    def __init__(self, dfa, codigo):
+        self.dfa = dfa
+        self.afd = AFD.from_dfa(dfa)
+        self.coincide = ejecutar(codigo)
+        self.vivos = vivos(self.afd)
+
+    def buscar(self, cadena):
+        return buscar(self.afd, self.vivos, cadena)
+
+
+class CacheAutomatas:
+    def __init__(self, capacidad=CACHE_MAX, ejecutor=None):
+        self.capacidad = capacidad
+        self.ejecutor = ejecutor
+        self.datos = OrderedDict()
+        self.pendientes = {}
+        self.aciertos = self.fallos = self.expulsados = 0
+
+    async def obtener(self, regex):
+        if regex in self.datos:
+            self.aciertos += 1
+            self.datos.move_to_end(regex)
+            return self.datos[regex]
+        self.fallos += 1
+        # Varias peticiones de la misma ER esperan a una sola compilación
+        if regex not in self.pendientes:
+            self.pendientes[regex] = asyncio.ensure_future(self._compilar(regex))
+        return await self.pendientes[regex]
+
+    async def _compilar(self, regex):
+        loop = asyncio.get_running_loop()
+        try:
+            dfa, codigo = await loop.run_in_executor(self.ejecutor, _compilar_en_proceso, regex)
+        finally:
+            del self.pendientes[regex]
+        compilado = Compilado(dfa, codigo)
+        self.datos[regex] = compilado
+        if len(self.datos) > self.capacidad:
+            self.datos.popitem(last=False)
+            self.expulsados += 1
+        return compilado
+
+    def stats(self):
+        total = self.aciertos + self.fallos
+        return {
+            'tamaño': len(self.datos),
+            'capacidad': self.capacidad,
+            'compilando': len(self.pendientes),
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'expulsados': self.expulsados,
+            'tasa_aciertos': self.aciertos / total if total else 0.0
+        }
+
+
+class Histograma:
+    # Cubetas en potencias de 2 de microsegundos
+    def __init__(self):
+        self.cubetas = {}
+        self.total = 0
+
+    def agregar(self, segundos):
+        us = max(1, int(segundos * 1e6))
+        cubeta = 1 << (us - 1).bit_length()
+        self.cubetas[cubeta] = self.cubetas.get(cubeta, 0) + 1
+        self.total += 1
+
+    def percentil(self, p):
+        objetivo = p * self.total
+        acumulado = 0
+        for cubeta in sorted(self.cubetas):
+            acumulado += self.cubetas[cubeta]
+            if acumulado >= objetivo:
+                return cubeta
+        return 0
+
+    def stats(self):
+        return {
+            'total': self.total,
+            'p50_us': self.percentil(0.50),
+            'p99_us': self.percentil(0.99),
+            'cubetas_us': {f"<={c}": n for c, n in sorted(self.cubetas.items())}
+        }
+
+
+class Servidor:
+    # Las compilaciones nuevas y las búsquedas (O(n²)) van a ejecutores aparte para no
+    # frenar el event loop; match y batch sobre autómatas ya compilados se atienden directo.
+    # Compilar y buscar usan pools distintos para que una búsqueda larga no demore las compilaciones.
+    def __init__(self, capacidad=CACHE_MAX, compilador=None, buscador=None):
+        self.buscador = buscador
+        self.cache = CacheAutomatas(capacidad, compilador)
+        self.latencias = {}
+        self.inicio = time.time()
+
+    async def atender(self, peticion):
+        op = peticion.get('op')
+        if op == 'stats':
+            return {
+                'cache': self.cache.stats(),
+                'latencias': {o: h.stats() for o, h in self.latencias.items()},
+                'segundos_activo': round(time.time() - self.inicio, 3)
+            }
+        if op not in OPERACIONES:
+            raise ValueError(f"Operación desconocida: {op}")
+        compilado = await self.cache.obtener(peticion['regex'])
+        if op == 'search':
+            # Se manda el AFD de la cache al pool, que no vuelve a compilar la ER
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.buscador, buscar, compilado.dfa,
+                                              compilado.vivos, peticion['cadena'])
+        if op == 'match':
+            return compilado.coincide(peticion['cadena'])
+        if op == 'batch':
+            coincide = compilado.coincide
+            return [coincide(c) for c in peticion['cadenas']]
+
+    async def _responder(self, linea):
+        respuesta = {}
+        op = 'error'
+        try:
+            peticion = json.loads(linea)
+            respuesta['id'] = peticion.get('id')
+            respuesta['resultado'] = await self.atender(peticion)
+            respuesta['ok'] = True
+            op = peticion.get('op')
+        except Exception as e:
+            respuesta['ok'] = False
+            respuesta['error'] = str(e)
+        return op, respuesta
+
+    async def conexion(self, reader, writer):
+        # Una petición JSON por línea. Cada petición se atiende en su propia tarea y las
+        # respuestas salen en el orden de llegada, así el cliente puede encadenarlas
+        # (pipelining) sin que una búsqueda lenta frene a las demás conexiones.
+        cola = asyncio.Queue(EN_VUELO_MAX)
+        escritor = asyncio.ensure_future(self._escribir(cola, writer))
+        try:
+            while True:
+                linea = await reader.readline()
+                if not linea:
+                    break
+                llegada = time.perf_counter()
+                await cola.put((llegada, asyncio.ensure_future(self._responder(linea))))
+        except ConnectionError:
+            pass
+        finally:
+            await cola.put(None)
+            await escritor
+            writer.close()
+
+    async def _escribir(self, cola, writer):
+        while True:
+            elemento = await cola.get()
+            if elemento is None:
+                return
+            llegada, tarea = elemento
+            op, respuesta = await tarea
+            try:
+                writer.write(json.dumps(respuesta, ensure_ascii=False).encode() + b"\n")
+                await writer.drain()
+            except ConnectionError:
+                pass
+            # Se mide desde que llegó la petición: incluye la espera detrás de las anteriores
+            self.latencias.setdefault(op, Histograma()).agregar(time.perf_counter() - llegada)
+
+
+async def iniciar(host=HOST, puerto=PUERTO, unix=None, capacidad=CACHE_MAX, compilador=None, buscador=None):
+    servidor = Servidor(capacidad, compilador, buscador)
+    if unix:
+        srv = await asyncio.start_unix_server(servidor.conexion, path=unix)
+    else:
+        srv = await asyncio.start_server(servidor.conexion, host, puerto)
+    return servidor, srv
+
+
+async def _main(args):
+    with ProcessPoolExecutor(args.procesos) as compilador, ProcessPoolExecutor(args.procesos) as buscador:
+        _, srv = await iniciar(args.host, args.puerto, args.unix, args.cache, compilador, buscador)
+        donde = args.unix or f"{args.host}:{args.puerto}"
+        print(f"Escuchando en {donde}", flush=True)
+        # Con SIGTERM se cierra ordenadamente para que el pool no deje procesos huérfanos
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, srv.close)
+        except (NotImplementedError, AttributeError):
+            pass
+        async with srv:
+            try:
+                await srv.serve_forever()
+            except asyncio.CancelledError:
+                pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servidor local de coincidencias con AFD")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--puerto", type=int, default=PUERTO)
+    parser.add_argument("--unix", help="ruta de un socket Unix en lugar de TCP")
+    parser.add_argument("--cache", type=int, default=CACHE_MAX, help="autómatas compilados en la LRU")
+    parser.add_argument("--procesos", type=int, help="procesos de cada pool, compilar y buscar (por defecto, uno por CPU)")
+    try:
+        asyncio.run(_main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
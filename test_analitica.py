@@ -0,0 +1,54 @@
+import itertools
+
+import pytest
+
+from afd import AFD
+from afnd import er_to_nfa
+from analitica import contar, contar_hasta, contar_potencia, muestra, palabras_mas_cortas
+
+ERS = ["ab|c*", "a*b*", "ab*|ba*c", "aab|bba|ab", "a"]
+
+
+def aceptadas(er, longitud):
+    afd = AFD.from_dfa(er_to_nfa(er).to_dfa())
+    return [''.join(p) for p in itertools.product(sorted(afd.alphabet), repeat=longitud)
+            if afd.accepts(''.join(p))]
+
+
+def test_conteos_contra_fuerza_bruta():
+    for er in ERS:
+        dfa = er_to_nfa(er).to_dfa()
+        esperado = [len(aceptadas(er, n)) for n in range(8)]
+        assert contar_hasta(dfa, 7) == esperado, er
+        for n in range(8):
+            assert contar(dfa, n) == contar_potencia(dfa, n) == esperado[n], (er, n)
+
+
+def test_longitud_grande():
+    # Todas las cadenas sobre {a,b}: 2^n de cada longitud
+    dfa = {'states': {'q0'}, 'alphabet': {'a', 'b'}, 'transitions': {'q0': {'a': 'q0', 'b': 'q0'}},
+           'start_state': 'q0', 'accept_states': {'q0'}}
+    assert contar(dfa, 300) == contar_potencia(dfa, 300) == 2 ** 300
+
+
+def test_palabras_mas_cortas():
+    for er in ERS:
+        esperado = [w for n in range(12) for w in aceptadas(er, n)][:10]
+        assert palabras_mas_cortas(er_to_nfa(er).to_dfa(), 10) == esperado, er
+    # Lenguaje finito: devuelve todas aunque se pidan más
+    assert palabras_mas_cortas(er_to_nfa("ab|ba").to_dfa(), 10) == ["ab", "ba"]
+
+
+def test_muestra():
+    dfa = er_to_nfa("ab*|ba*c").to_dfa()
+    validas = set(aceptadas("ab*|ba*c", 5))
+    palabras = muestra(dfa, 5, 2000, semilla=0)
+    assert set(palabras) == validas
+    assert muestra(dfa, 5, 3, semilla=7) == muestra(dfa, 5, 3, semilla=7)
+    assert muestra(er_to_nfa("ab").to_dfa(), 3) is None
+
+
+@pytest.mark.parametrize("funcion", [contar, contar_hasta, contar_potencia, muestra])
+def test_longitud_negativa(funcion):
+    with pytest.raises(ValueError):
+        funcion(er_to_nfa("a*").to_dfa(), -1)
@@ -0,0 +1,52 @@
+import random
+
+from afd import AFD
+from afnd import er_to_nfa
+from ayudas_prueba import afd_al_azar, palabras
+from codegen import afd_alfanumerico, compilar, compilar_en_cache
+
+
+def test_igual_que_accepts():
+    r = random.Random(0)
+    # Incluye símbolos fuera del alfabeto, que deben rechazarse
+    ws = palabras("abc", 6)
+    for _ in range(100):
+        dfa = afd_al_azar(r, r.randint(1, 5), "ab")
+        afd, coincide = AFD.from_dfa(dfa), compilar(dfa)
+        for w in ws:
+            assert coincide(w) == afd.accepts(w), w
+
+
+def test_desde_er():
+    for er in ["ab*|ba", "a*b*c", "abc|c*", "aab|bba|ab"]:
+        dfa = er_to_nfa(er).to_dfa()
+        afd, coincide = AFD.from_dfa(dfa), compilar(dfa)
+        for w in palabras("abc", 6):
+            assert coincide(w) == afd.accepts(w), (er, w)
+
+
+def test_alfanumerico():
+    dfa = afd_alfanumerico()
+    afd, coincide = AFD.from_dfa(dfa), compilar(dfa)
+    r = random.Random(1)
+    for _ in range(500):
+        w = ''.join(r.choice("abcxyz0189") for _ in range(r.randint(0, 30)))
+        assert coincide(w) == afd.accepts(w), w
+
+
+def test_cache_en_disco(tmp_path):
+    dfa = er_to_nfa("ab*").to_dfa()
+    coincide = compilar_en_cache(dfa, carpeta=str(tmp_path))
+    assert coincide("abbb") and not coincide("ba")
+    assert len(list(tmp_path.glob("afd_*.py"))) == 1
+
+
+def test_cache_en_disco_concurrente(tmp_path):
+    # Varios hilos guardando el mismo AFD a la vez no deben pisarse el temporal
+    from concurrent.futures import ThreadPoolExecutor
+    dfa = afd_alfanumerico(semilla=3)
+    carpeta = str(tmp_path)
+    with ThreadPoolExecutor(8) as ejecutor:
+        for coincide in ejecutor.map(lambda _: compilar_en_cache(dfa, carpeta=carpeta), range(32)):
+            assert coincide("") == AFD.from_dfa(dfa).accepts("")
+    assert [p.suffix for p in tmp_path.iterdir() if p.is_file()] == [".py"]
@@ -0,0 +1,65 @@
+import itertools
+
+from afd import AFD
+from afnd import er_to_nfa
+from ayudas_prueba import palabras
+from equivalencia import equivalentes, incluido, regresion
+
+
+def afd(er):
+    return er_to_nfa(er).to_dfa()
+
+
+def test_equivalentes():
+    assert equivalentes(afd("a*a*"), afd("a*")) == (True, None)
+    assert equivalentes(afd("ab|ba"), afd("ba|ab")) == (True, None)
+
+
+def test_contraejemplo_mas_corto():
+    iguales, w = equivalentes(afd("a*"), afd("aa*"))
+    assert (iguales, w) == (False, "")
+    iguales, w = equivalentes(afd("ab|ba|aab"), afd("ab|ba"))
+    assert (iguales, w) == (False, "aab")
+    iguales, w = equivalentes(afd("ab*"), afd("abbb*"))
+    assert (iguales, w) == (False, "a")
+
+
+def test_incluido():
+    assert incluido(afd("ab"), afd("ab|ba")) == (True, None)
+    assert incluido(afd("abb*"), afd("ab*")) == (True, None)
+    incluye, w = incluido(afd("ab*"), afd("abb*"))
+    assert (incluye, w) == (False, "a")
+    incluye, w = incluido(afd("a|c"), afd("a|b"))
+    assert (incluye, w) == (False, "c")
+
+
+def test_contra_fuerza_bruta():
+    ers = ["a*b", "ab|b", "a*b*", "ba*|b", "aa*b|b"]
+    for x, y in itertools.product(ers, repeat=2):
+        a, b = AFD.from_dfa(afd(x)), AFD.from_dfa(afd(y))
+        ws = palabras("ab", 6)
+        iguales, w = equivalentes(a, b)
+        assert iguales == all(a.accepts(v) == b.accepts(v) for v in ws)
+        if not iguales:
+            assert a.accepts(w) != b.accepts(w)
+        incluye, w = incluido(a, b)
+        assert incluye == all(b.accepts(v) for v in ws if a.accepts(v))
+        if not incluye:
+            assert a.accepts(w) and not b.accepts(w)
+
+
+def test_regresion_con_afd_esperado():
+    # ab* con el formato de hola.py, y uno mal a propósito
+    bien = "ab*\tq0,q1\ta,b\tq0\tq1\tq0,a,q1;q1,b,q1"
+    mal = "ab*\tq0,q1\ta,b\tq0\tq1\tq0,a,q1;q1,a,q1"
+    fallos, sin_oraculo = regresion([bien, mal, "a(b"])
+    assert [p for p, _ in fallos] == ["ab*", "a(b"]
+    assert sin_oraculo == []
+
+
+def test_regresion_con_transiciones_mal_escritas():
+    # Una línea con transiciones mal formadas no corta la corrida
+    roto = "ab*\tq0,q1\ta,b\tq0\tq1\tq0,a"
+    bien = "ab*\tq0,q1\ta,b\tq0\tq1\tq0,a,q1;q1,b,q1"
+    fallos, _ = regresion([roto, bien])
+    assert fallos == [("ab*", "Formato: q0,a")]
@@ -0,0 +1,62 @@
+import random
+
+from afd import AFD
+from ayudas_prueba import afd_al_azar, palabras
+from equivalencia import equivalentes
+from producto import complemento, diferencia, interseccion, union
+
+OPERACIONES = [
+    (interseccion, lambda x, y: x and y),
+    (union, lambda x, y: x or y),
+    (diferencia, lambda x, y: x and not y),
+]
+
+
+def test_operaciones_contra_fuerza_bruta():
+    r = random.Random(0)
+    ws = palabras("abc", 6)
+    for _ in range(50):
+        a = afd_al_azar(r, r.randint(1, 4), "ab")
+        b = afd_al_azar(r, r.randint(1, 4), r.choice(["ab", "bc"]))
+        A, B = AFD.from_dfa(a), AFD.from_dfa(b)
+        for operacion, esperado in OPERACIONES:
+            p = operacion(a, b)
+            d = AFD.from_dfa(p.to_dict())
+            m = AFD.from_dfa(p.minimizar())
+            for w in ws:
+                e = esperado(A.accepts(w), B.accepts(w))
+                assert p.accepts(w) == d.accepts(w) == m.accepts(w) == e, (operacion.__name__, w)
+
+
+def test_complemento():
+    r = random.Random(1)
+    ws = palabras("abc", 6)
+    for _ in range(50):
+        a = afd_al_azar(r, r.randint(1, 4), "ab")
+        A, c = AFD.from_dfa(a), complemento(a)
+        for w in ws:
+            # Solo sobre el alfabeto del autómata
+            assert c.accepts(w) == (set(w) <= {"a", "b"} and not A.accepts(w))
+        assert equivalentes(complemento(c), a)[0]
+
+
+def test_producto_perezoso():
+    # Solo se calculan las transiciones que recorre la cadena probada
+    r = random.Random(2)
+    p = interseccion(afd_al_azar(r, 4, "ab"), afd_al_azar(r, 4, "ab"))
+    p.accepts("abab")
+    assert len(p.cache) <= 4
+
+
+def test_poda_de_estados_muertos():
+    # to_dfa() es completo y tiene un sumidero explícito: sus pares tampoco se exploran
+    from afd import vivos
+    from afnd import er_to_nfa
+    a, b = er_to_nfa("ab*").to_dfa(), er_to_nfa("a*b").to_dfa()
+    va, vb = vivos(a), vivos(b)
+    for operacion in (interseccion, diferencia, union):
+        p = operacion(a, b)
+        p.to_dict()
+        for par in p.cache.values():
+            assert par is None or (par[0] in va | {None} and par[1] in vb | {None})
+    assert len(interseccion(a, b).to_dict()['states']) == 3
@@ -0,0 +1,107 @@
+import asyncio
+import json
+import threading
+
+import servidor
+from servidor import iniciar
+
+
+def correr(prueba, **opciones):
+    # Levanta el servidor en un puerto libre, corre la prueba con un cliente y lo cierra
+    async def principal():
+        app, srv = await iniciar(puerto=0, **opciones)
+        puerto = srv.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", puerto)
+
+        async def enviar(*peticiones):
+            # Todas las peticiones salen juntas (pipelining) y después se leen las respuestas
+            for p in peticiones:
+                linea = p if isinstance(p, str) else json.dumps(p)
+                writer.write(linea.encode() + b"\n")
+            await writer.drain()
+            return [json.loads(await reader.readline()) for _ in peticiones]
+
+        try:
+            return await prueba(app, enviar)
+        finally:
+            writer.close()
+            srv.close()
+            await srv.wait_closed()
+    return asyncio.run(principal())
+
+
+def test_respuestas_en_orden():
+    async def prueba(app, enviar):
+        # Una búsqueda lenta primero: las respuestas rápidas igual salen detrás
+        peticiones = [{'id': 0, 'op': 'search', 'regex': 'a*c', 'cadena': 'a' * 1500 + 'b'}]
+        peticiones += [{'id': i, 'op': 'match', 'regex': 'ab*', 'cadena': 'a' + 'b' * i}
+                       for i in range(1, 20)]
+        respuestas = await enviar(*peticiones)
+        assert [r['id'] for r in respuestas] == list(range(20))
+        assert respuestas[0]['resultado'] is None
+        assert all(r['resultado'] is True for r in respuestas[1:])
+    correr(prueba)
+
+
+def test_una_compilacion_por_er(monkeypatch):
+    compilaciones = []
+    compilar = servidor._compilar_en_proceso
+    listo = threading.Event()
+
+    def contar(regex):
+        compilaciones.append(regex)
+        # Se demora para que todas las peticiones lleguen mientras compila
+        listo.wait(1)
+        return compilar(regex)
+    monkeypatch.setattr(servidor, "_compilar_en_proceso", contar)
+
+    async def prueba(app, enviar):
+        asyncio.get_running_loop().call_later(0.1, listo.set)
+        peticiones = [{'id': i, 'op': 'match', 'regex': 'a*b', 'cadena': 'aab'} for i in range(10)]
+        peticiones.append({'id': 10, 'op': 'search', 'regex': 'a*b', 'cadena': 'xxaab'})
+        respuestas = await enviar(*peticiones)
+        assert all(r['ok'] for r in respuestas)
+        assert respuestas[-1]['resultado'] == [2, 5]
+        assert compilaciones == ['a*b']
+        cache = (await enviar({'op': 'stats'}))[0]['resultado']['cache']
+        assert cache['tamaño'] == 1 and cache['compilando'] == 0
+        assert cache['aciertos'] + cache['fallos'] == 11
+    correr(prueba)
+
+
+def test_search_usa_la_cache():
+    async def prueba(app, enviar):
+        for _ in range(5):
+            respuesta = (await enviar({'op': 'search', 'regex': 'ba', 'cadena': 'aaba'}))[0]
+            assert respuesta['resultado'] == [2, 4]
+        cache = app.cache.stats()
+        assert (cache['aciertos'], cache['fallos'], cache['tamaño']) == (4, 1, 1)
+    correr(prueba)
+
+
+def test_lru_expulsa():
+    async def prueba(app, enviar):
+        for regex in ['a', 'b', 'a', 'c', 'b']:
+            assert (await enviar({'op': 'match', 'regex': regex, 'cadena': regex}))[0]['resultado']
+        cache = app.cache.stats()
+        # 'c' expulsa a 'b', que se usó hace más que 'a'; al volver, 'b' expulsa a 'a'
+        assert list(app.cache.datos) == ['c', 'b']
+        assert (cache['tamaño'], cache['expulsados'], cache['aciertos'], cache['fallos']) == (2, 2, 1, 4)
+    correr(prueba, capacidad=2)
+
+
+def test_peticiones_invalidas():
+    async def prueba(app, enviar):
+        respuestas = await enviar(
+            "esto no es json",
+            {'id': 1, 'op': 'match', 'cadena': 'a'},
+            {'id': 2, 'op': 'match', 'regex': 'a||b', 'cadena': 'a'},
+            {'id': 3, 'op': 'nope', 'regex': 'ab', 'cadena': 'ab'},
+            {'id': 4, 'op': 'match', 'regex': 'ab', 'cadena': 'ab'},
+        )
+        assert [r['ok'] for r in respuestas] == [False, False, False, False, True]
+        assert [r.get('id') for r in respuestas] == [None, 1, 2, 3, 4]
+        # La operación desconocida se rechaza sin tocar la cache
+        assert list(app.cache.datos) == ['ab']
+        assert app.cache.stats()['fallos'] == 2
+    correr(prueba)
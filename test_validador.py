@@ -0,0 +1,66 @@
+import pytest
+
+from afd import AFD
+from afnd import er_to_nfa
+from validador import ErrorSintaxis, analizar, validar, validar_lineas
+
+
+@pytest.mark.parametrize("expr, posicion, esperados", [
+    ("|a", 0, ("símbolo",)),
+    ("a|", 2, ("símbolo",)),
+    ("ab||c", 3, ("símbolo",)),
+    ("*a", 0, ("símbolo",)),
+    ("a b", 1, ("símbolo", "'*'", "'|'", "fin de la expresión")),
+    ("", 0, ("símbolo",)),
+])
+def test_errores(expr, posicion, esperados):
+    error = validar(expr)
+    assert isinstance(error, ErrorSintaxis)
+    assert (error.posicion, error.esperados) == (posicion, esperados)
+
+
+def test_validas():
+    for expr in ["a", "ab*", "a**|b", "abc|c*|0"]:
+        assert validar(expr) is None
+
+
+def test_error_nuevo_en_cada_llamada():
+    # La entrada de la cache es la misma, pero la excepción no
+    assert validar("a|") is not validar("a|")
+    errores = []
+    for _ in range(3):
+        with pytest.raises(ErrorSintaxis) as info:
+            analizar("a|")
+        errores.append(info.value)
+    assert errores[0] is not errores[1]
+    assert str(errores[0]) == str(errores[2])
+    # El traceback no crece de una llamada a otra
+    assert _frames(errores[0]) == _frames(errores[2])
+
+
+def _frames(error):
+    n, tb = 0, error.__traceback__
+    while tb:
+        n, tb = n + 1, tb.tb_next
+    return n
+
+
+def test_validar_lineas():
+    lineas = ["ab\n", "\n", "a|\r\n", "b*\n", "(\n"]
+    errores = validar_lineas(lineas)
+    assert [(num, expr) for num, expr, _ in errores] == [(3, "a|"), (5, "(")]
+
+
+def test_precedencia():
+    # La estrella se aplica al símbolo anterior y la concatenación va antes que '|'
+    ab = AFD.from_dfa(er_to_nfa("ab*").to_dfa())
+    assert ab.accepts("a") and ab.accepts("abbb")
+    assert not ab.accepts("") and not ab.accepts("abab")
+    alt = AFD.from_dfa(er_to_nfa("ab|c").to_dfa())
+    assert alt.accepts("ab") and alt.accepts("c")
+    assert not alt.accepts("ac") and not alt.accepts("abc")
+
+
+def test_er_invalida():
+    assert er_to_nfa("") is None
+    assert er_to_nfa("a||b") is None
@@ -0,0 +1,134 @@
+import sys
+import time
+from functools import lru_cache
+
+# Gramática de las expresiones; er_to_nfa construye el AFND sobre este mismo AST:
+#   expr   := termino ('|' termino)*
+#   termino:= factor factor*
+#   factor := SIMBOLO '*'*
+# SIMBOLO es cualquier carácter alfanumérico.
+UNION, ESTRELLA = '|', '*'
+CACHE_MAX = 1024
+
+
+class ErrorSintaxis(ValueError):
+    def __init__(self, expr, posicion, esperados):
+        self.expr = expr
+        self.posicion = posicion
+        self.esperados = tuple(esperados)
+        encontrado = repr(expr[posicion]) if posicion < len(expr) else "fin de la expresión"
+        super().__init__(
+            f"posición {posicion}: se esperaba {' o '.join(self.esperados)}, se encontró {encontrado}"
+        )
+
+
+# El AST se arma con tuplas para que se pueda compartir entre entradas de la cache:
+#   ('sym', 'a') | ('star', nodo) | ('cat', (nodos...)) | ('alt', (nodos...))
+def _parse(expr):
+    n = len(expr)
+    i = 0
+    alternativas = []
+    while True:
+        factores = []
+        while i < n and expr[i].isalnum():
+            nodo = ('sym', expr[i])
+            i += 1
+            while i < n and expr[i] == ESTRELLA:
+                if nodo[0] != 'star':
+                    nodo = ('star', nodo)
+                i += 1
+            factores.append(nodo)
+        if not factores:
+            raise ErrorSintaxis(expr, i, ["símbolo"])
+        alternativas.append(factores[0] if len(factores) == 1 else ('cat', tuple(factores)))
+        if i == n:
+            break
+        if expr[i] != UNION:
+            raise ErrorSintaxis(expr, i, ["símbolo", "'*'", "'|'", "fin de la expresión"])
+        i += 1
+    return alternativas[0] if len(alternativas) == 1 else ('alt', tuple(alternativas))
+
+
+# Se guardan los datos del error y no la excepción: relanzar la misma instancia
+# le iría sumando frames al __traceback__ que la cache mantendría vivos
+@lru_cache(maxsize=CACHE_MAX)
+def _analizar_cache(expr):
+    try:
+        return _parse(expr), None
+    except ErrorSintaxis as e:
+        return None, (e.posicion, e.esperados)
+
+
+def analizar(expr):
+    ast, error = _analizar_cache(expr)
+    if error:
+        raise ErrorSintaxis(expr, *error)
+    return ast
+
+
+def validar(expr):
+    _, error = _analizar_cache(expr)
+    return ErrorSintaxis(expr, *error) if error else None
+
+
+def validar_lineas(lineas):
+    errores = []
+    for num, linea in enumerate(lineas, 1):
+        expr = linea.rstrip("\r\n")
+        if not expr:
+            continue
+        error = validar(expr)
+        if error:
+            errores.append((num, expr, error))
+    return errores
+
+
+def validar_archivo(ruta):
+    with open(ruta, encoding="utf-8") as f:
+        return validar_lineas(f)
+
+
+def benchmark(exprs, repeticiones=3):
+    exprs = list(exprs)
+    resultados = {}
+    # Se usa _parse directo para medir el analizador y no la cache
+    t = time.perf_counter()
+    for _ in range(repeticiones):
+        for e in exprs:
+            try:
+                _parse(e)
+            except ErrorSintaxis:
+                pass
+    resultados['validador'] = len(exprs) * repeticiones / (time.perf_counter() - t)
+    try:
+        from pyformlang.regular_expression import Regex
+    except ImportError:
+        return resultados
+    t = time.perf_counter()
+    for _ in range(repeticiones):
+        for e in exprs:
+            try:
+                Regex(e)
+            except Exception:
+                pass
+    resultados['pyformlang'] = len(exprs) * repeticiones / (time.perf_counter() - t)
+    return resultados
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Uso: python validador.py archivo.txt [--bench]")
+        sys.exit(2)
+    ruta = sys.argv[1]
+    t = time.perf_counter()
+    errores = validar_archivo(ruta)
+    total = time.perf_counter() - t
+    for num, expr, error in errores:
+        print(f"{ruta}:{num}: {expr!r}: {error}")
+    print(f"{len(errores)} expresiones inválidas ({total:.3f} s)")
+    if "--bench" in sys.argv[2:]:
+        with open(ruta, encoding="utf-8") as f:
+            exprs = [l.rstrip("\r\n") for l in f if l.strip()]
+        for nombre, tasa in benchmark(exprs).items():
+            print(f"{nombre}: {tasa:,.0f} expr/s")
+    sys.exit(1 if errores else 0)